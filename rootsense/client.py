@@ -120,6 +120,9 @@ class RootSenseClient:
             
             # Flush and shutdown collector
             self.error_collector.flush(timeout=5)
+            
+            # Send anything still queued in the transport
+            self.transport.close()
             self._initialized = False
            
             if self.config.debug:
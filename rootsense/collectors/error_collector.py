@@ -7,6 +7,7 @@ import threading
 import time
 import traceback
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
@@ -22,6 +23,9 @@ logger = logging.getLogger(__name__)
 class ErrorCollector:
     """Collects and buffers error events with integrated Prometheus metrics and auto-resolution tracking."""
 
+    # Cap on fingerprints tracked for auto-resolution; least recently seen are evicted
+    MAX_TRACKED_FINGERPRINTS = 1024
+
     def __init__(self, config, http_transport):
         self.config = config
         self.http_transport = http_transport
@@ -31,8 +35,8 @@ class ErrorCollector:
         self._local = threading.local()
         
         # Auto-resolution tracking
-        self._recent_errors = {}  # fingerprint -> last_error_time
-        self._recent_successes = {}  # fingerprint -> last_success_time
+        self._recent_errors = OrderedDict()  # fingerprint -> last_error_time
+        self._recent_successes = OrderedDict()  # fingerprint -> last_success_time
         self._lock = threading.RLock()
        
         # Initialize Prometheus metrics if available
@@ -70,7 +74,7 @@ class ErrorCollector:
     def _worker(self):
         """Background worker that batches and sends events."""
         batch = []
-        last_flush = time.time()
+        last_flush = time.monotonic()
        
         while not self._stop_event.is_set():
             try:
@@ -88,7 +92,7 @@ class ErrorCollector:
                 # Flush if batch is full or enough time has passed
                 should_flush = (
                     len(batch) >= 100 or
-                    (len(batch) > 0 and time.time() - last_flush >= 5)
+                    (len(batch) > 0 and time.monotonic() - last_flush >= 5)
                 )
                
                 if should_flush:
@@ -99,7 +103,7 @@ class ErrorCollector:
                     
                     self._send_batch(batch)
                     batch = []
-                    last_flush = time.time()
+                    last_flush = time.monotonic()
                    
             except Exception as e:
                 logger.error(f"Error in worker thread: {e}")
@@ -162,7 +166,7 @@ class ErrorCollector:
                         "labels": sample.labels,
                         "value": sample.value,
                         # Use sample timestamp if available, otherwise current time
-                        "time_unix_nano": int(sample.timestamp * 1e9) if sample.timestamp else int(time.time() * 1e9)
+                        "time_unix_nano": int(sample.timestamp * 1e9) if sample.timestamp else time.time_ns()
                     }
                     events.append(event)
                     
@@ -192,7 +196,7 @@ class ErrorCollector:
         
         # Track for auto-resolution
         with self._lock:
-            self._recent_errors[fingerprint] = datetime.utcnow()
+            self._track(self._recent_errors, fingerprint)
        
         event = {
             "event_id": event_id,
@@ -200,7 +204,9 @@ class ErrorCollector:
             "type": "error",
             "exception_type": error_type,
             "message": str(exception),
-            "stack_trace": traceback.format_exc(),
+            "stack_trace": "".join(traceback.format_exception(
+                type(exception), exception, exception.__traceback__
+            )),
             "fingerprint": fingerprint,
             "environment": self.config.environment,
             "project_id": self.config.project_id,
@@ -242,7 +248,7 @@ class ErrorCollector:
         fingerprint = self._generate_success_fingerprint(endpoint)
         
         with self._lock:
-            self._recent_successes[fingerprint] = datetime.utcnow()
+            self._track(self._recent_successes, fingerprint)
             
             # Check if this endpoint had recent errors
             if fingerprint in self._recent_errors:
@@ -259,12 +265,19 @@ class ErrorCollector:
                     if context:
                         success_context.update(context)
                     
-                    # Send success signal to backend
-                    self.http_transport.send_success_signal(fingerprint, success_context)
+                    # Send success signal to backend without blocking the caller
+                    self.http_transport.enqueue_success_signal(fingerprint, success_context)
                     
                     # Clean up old error tracking
                     del self._recent_errors[fingerprint]
 
+    def _track(self, tracked: OrderedDict, fingerprint: str):
+        """Record the latest time a fingerprint was seen, evicting the oldest when full."""
+        tracked[fingerprint] = datetime.utcnow()
+        tracked.move_to_end(fingerprint)
+        if len(tracked) > self.MAX_TRACKED_FINGERPRINTS:
+            tracked.popitem(last=False)
+
     def capture_message(
         self,
         message: str,
@@ -326,9 +339,9 @@ class ErrorCollector:
 
     def flush(self, timeout: float = 5):
         """Flush all pending events."""
-        deadline = time.time() + timeout
+        deadline = time.monotonic() + timeout
        
-        while not self._queue.empty() and time.time() < deadline:
+        while not self._queue.empty() and time.monotonic() < deadline:
             time.sleep(0.1)
        
         # Send remaining events
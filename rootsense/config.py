@@ -24,6 +24,9 @@ class Config:
         max_breadcrumbs: int = 100,
         buffer_size: int = 1000,
         enable_auto_instrumentation: bool = True,
+        batch_interval_ms: int = 1000,
+        max_batch_size: int = 100,
+        pool_size: int = 32,
     ):
         """Initialize SDK configuration.
         
@@ -41,6 +44,9 @@ class Config:
             max_breadcrumbs: Maximum breadcrumbs to store
             buffer_size: Event buffer size
             enable_auto_instrumentation: Enable OpenTelemetry auto-instrumentation (default: True)
+            batch_interval_ms: Max time queued events wait before being sent (default: 1000)
+            max_batch_size: Max events sent in a single batch request (default: 100)
+            pool_size: Max keep-alive connections held open to the backend (default: 32)
         """
         # Parse connection string if provided
         if connection_string:
@@ -65,6 +71,11 @@ class Config:
                 "or ROOTSENSE_PROJECT_ID environment variable"
             )
         
+        if batch_interval_ms <= 0:
+            raise ValueError(f"batch_interval_ms must be greater than 0, got: {batch_interval_ms}")
+        if max_batch_size <= 0:
+            raise ValueError(f"max_batch_size must be greater than 0, got: {max_batch_size}")
+        
         self.api_key = api_key
         self.project_id = project_id
         self.backend_url = backend_url.rstrip('/')  
@@ -78,6 +89,9 @@ class Config:
         self.max_breadcrumbs = max_breadcrumbs
         self.buffer_size = buffer_size
         self.enable_auto_instrumentation = enable_auto_instrumentation
+        self.batch_interval_ms = batch_interval_ms
+        self.max_batch_size = max_batch_size
+        self.pool_size = pool_size
         
         # Construct API endpoints
         self.events_endpoint = f"{self.backend_url}/v1/projects/{self.project_id}/events"
@@ -39,7 +39,7 @@ class RootSenseSpanExporter(SpanExporter):
             
             # Batch send events
             if events:
-                self.http_transport.send_events(events)
+                self.http_transport.enqueue_events(events)
             
             return SpanExportResult.SUCCESS
             
@@ -137,7 +137,7 @@ class RootSenseSpanExporter(SpanExporter):
         }
         
         # Send success signal for auto-resolution
-        self.http_transport.send_success_signal(fingerprint, context)
+        self.http_transport.enqueue_success_signal(fingerprint, context)
 
     def _generate_fingerprint(self, operation_type: str, name: str, attributes: dict) -> str:
         """Generate unique fingerprint for operation."""
@@ -165,12 +165,12 @@ class RootSenseSpanExporter(SpanExporter):
             return f"{operation_type}:{name}"
 
     def shutdown(self) -> None:
-        """Shutdown the exporter."""
-        pass
+        """Shutdown the exporter, sending any spans still queued."""
+        self.force_flush()
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
         """Force flush pending spans."""
-        return True
+        return self.http_transport.flush(timeout=timeout_millis / 1000)
 
 
 class RootSenseMetricExporter(MetricExporter):
@@ -193,7 +193,7 @@ class RootSenseMetricExporter(MetricExporter):
             
             # Batch send events
             if events:
-                self.http_transport.send_events(events)
+                self.http_transport.enqueue_events(events)
             
             return MetricExportResult.SUCCESS
             
@@ -238,9 +238,9 @@ class RootSenseMetricExporter(MetricExporter):
         return event
 
     def shutdown(self, timeout_millis: float = 30000, **kwargs) -> None:
-        """Shutdown the exporter."""
-        pass
+        """Shutdown the exporter, sending any metrics still queued."""
+        self.force_flush(timeout_millis)
 
     def force_flush(self, timeout_millis: float = 10000) -> bool:
         """Force flush pending metrics."""
-        return True
+        return self.http_transport.flush(timeout=timeout_millis / 1000)
@@ -1,55 +1,257 @@
 """HTTP transport for sending events."""
 
+import json
 import logging
+import threading
 import time
-from typing import List, Dict, Any
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request payload to UTF-8 JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _resolved(result: bool) -> Future:
+    """Return a Future that has already completed with ``result``."""
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+# (connect, read) timeouts in seconds
+EVENTS_TIMEOUT = (3.05, 10)
+SUCCESS_SIGNAL_TIMEOUT = (3.05, 5)
+
+# Longest Retry-After honored, in seconds; sends run on the flusher, the
+# collector worker and close(), so a long server delay would stall them all
+MAX_RETRY_AFTER = 2.0
+
+# Longest close() waits for queued work before dropping it, in seconds
+CLOSE_TIMEOUT = 5.0
+
+# Background threads sending success signals off the caller's thread
+SUCCESS_SIGNAL_WORKERS = 2
+
+
+class _LoggingRetry(Retry):
+    """urllib3 Retry that logs each retry on an error status and caps Retry-After.
+
+    urllib3 already warns about retried connection errors, but only logs
+    status retries at debug level.
+    """
+
+    def parse_retry_after(self, retry_after: str) -> float:
+        return min(super().parse_retry_after(retry_after), MAX_RETRY_AFTER)
+
+    def increment(self, method=None, url=None, response=None, error=None, *args, **kwargs):
+        # Raises once retries are exhausted, so only real retries get logged
+        new_retry = super().increment(method, url, response, error, *args, **kwargs)
+        if response is not None:
+            logger.warning(f"Retrying {method} {url} after: {response.status}")
+        return new_retry
+
+
+class _BatchBuffer:
+    """Coalesces events from many callers into as few batch requests as possible.
+
+    Events are held until either ``max_batch_size`` events are pending or
+    ``batch_interval_ms`` has elapsed, then drained by a daemon flusher thread.
+    At most ``max_size`` events are held; further events are dropped, as are
+    events added after ``close``.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[List[Dict[str, Any]]], bool],
+        batch_interval_ms: int,
+        max_batch_size: int,
+        max_size: int,
+    ):
+        self._send = send
+        self._interval = batch_interval_ms / 1000.0
+        self._max_batch_size = max_batch_size
+        self._max_size = max_size
+        self._events = deque()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop_event = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+
+    def add(self, events: List[Dict[str, Any]]):
+        """Queue events, waking the flusher early if a full batch is pending."""
+        with self._lock:
+            if self._stop_event.is_set():
+                logger.warning(f"Transport is closed, dropping {len(events)} events")
+                return
+            room = self._max_size - len(self._events)
+            if len(events) > room:
+                logger.warning(f"Event batch buffer is full, dropping {len(events) - room} events")
+                events = events[:room]
+            self._events.extend(events)
+            full = len(self._events) >= self._max_batch_size
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        if full:
+            self._wakeup.set()
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        """Pop up to one batch worth of events."""
+        with self._lock:
+            count = min(len(self._events), self._max_batch_size)
+            return [self._events.popleft() for _ in range(count)]
+
+    def _run(self):
+        """Flusher loop."""
+        while not self._stop_event.is_set():
+            self._wakeup.wait(self._interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send everything currently queued.
+
+        Waits for a batch already being sent by the flusher. With a
+        ``timeout``, no new batch is started once it has elapsed. Returns
+        True if the queue was drained.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._flush_lock.acquire(timeout=-1 if timeout is None else timeout):
+            return False
+        try:
+            while True:
+                if deadline is not None and time.monotonic() >= deadline:
+                    return not self._events
+                batch = self._drain()
+                if not batch:
+                    return True
+                try:
+                    self._send(batch)
+                except Exception as e:
+                    logger.error(f"Failed to send batch: {e}")
+        finally:
+            self._flush_lock.release()
+
+    def close(self, timeout: float = CLOSE_TIMEOUT):
+        """Stop the flusher and send remaining events for up to ``timeout`` seconds."""
+        deadline = time.monotonic() + timeout
+        self._stop_event.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+        if not self.flush(timeout=max(deadline - time.monotonic(), 0)):
+            with self._lock:
+                dropped = len(self._events)
+                self._events.clear()
+            logger.warning(f"Transport close timed out, dropping {dropped} events")
+
+
 class HttpTransport:
-    """HTTP transport with retry logic."""
+    """HTTP transport with connection pooling and retry logic."""
 
     def __init__(self, config):
         self.config = config
+        self._batch_url = f"{config.base_url}/events/batch"
+        self._success_url = f"{config.base_url}/events/success"
         self.session = requests.Session()
+        
+        # Retries happen inside urllib3 with jittered exponential backoff
+        retry = _LoggingRetry(
+            total=3,
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        
+        # All requests go to the same host, so keep connections alive and
+        # size the pool for the worker and exporter threads sharing it.
+        adapter = HTTPAdapter(
+            pool_connections=config.pool_size,
+            pool_maxsize=config.pool_size,
+            max_retries=retry,
+            pool_block=False,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             "X-API-Key": config.api_key,
             "Content-Type": "application/json",
+            "Connection": "keep-alive",
             "User-Agent": f"rootsense-python-sdk/0.1.0"
         })
+        self._batch_buffer = _BatchBuffer(
+            self.send_events,
+            batch_interval_ms=config.batch_interval_ms,
+            max_batch_size=config.max_batch_size,
+            max_size=config.buffer_size,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=SUCCESS_SIGNAL_WORKERS,
+            thread_name_prefix="rootsense-transport"
+        )
+        # Submitted signals not yet sent, bounded by buffer_size
+        self._pending_signals = set()
+        self._signals_lock = threading.Lock()
+
+    def enqueue_events(self, events: List[Dict[str, Any]]):
+        """Queue events to be sent with others in a single batch request.
+
+        Unlike ``send_events`` this returns immediately; events are flushed
+        every ``batch_interval_ms`` or as soon as ``max_batch_size`` are queued.
+        Events beyond ``buffer_size`` pending, or sent after ``close``, are dropped.
+        """
+        self._batch_buffer.add(events)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send queued events now, for up to ``timeout`` seconds.
+
+        Returns True if every queued event was sent.
+        """
+        return self._batch_buffer.flush(timeout)
 
     def send_events(self, events: List[Dict[str, Any]]) -> bool:
-        """Send a batch of events with retry logic."""
-        url = f"{self.config.base_url}/events/batch"
+        """Send a batch of events.
+
+        Server errors and connection failures are retried by the session's
+        adapter with jittered backoff, honoring ``Retry-After``.
+        """
+        try:
+            response = self.session.post(
+                self._batch_url,
+                data=_dumps({"events": events}),
+                timeout=EVENTS_TIMEOUT
+            )
+        except requests.RequestException as e:
+            logger.error(f"Request error sending events: {e}")
+            return False
        
-        for attempt in range(3):
-            try:
-                response = self.session.post(
-                    url,
-                    json={"events": events},
-                    timeout=10
-                )
-               
-                if response.status_code == 200:
-                    return True
-               
-                if response.status_code < 500:
-                    # Client error, don't retry
-                    logger.error(f"Client error sending events: {response.status_code} {response.text}")
-                    return False
-               
-                # Server error, retry
-                logger.warning(f"Server error (attempt {attempt + 1}/3): {response.status_code}")
-               
-            except requests.RequestException as e:
-                logger.error(f"Request error (attempt {attempt + 1}/3): {e}")
-           
-            # Exponential backoff
-            if attempt < 2:
-                time.sleep(2 ** attempt)
+        if response.status_code == 200:
+            return True
        
+        if response.status_code < 500:
+            logger.error(f"Client error sending events: {response.status_code} {response.text}")
+        else:
+            logger.error(f"Server error sending events: {response.status_code}")
         return False
 
     def send_success_signal(self, fingerprint: str, context: Dict[str, Any]) -> bool:
@@ -65,20 +267,57 @@ class HttpTransport:
         Returns:
             True if signal was sent successfully, False otherwise
         """
-        url = f"{self.config.base_url}/events/success"
-       
         try:
             response = self.session.post(
-                url,
-                json={
+                self._success_url,
+                data=_dumps({
                     "fingerprint": fingerprint,
                     "context": context,
                     "project_id": self.config.project_id,
                     "environment": self.config.environment
-                },
-                timeout=5
+                }),
+                timeout=SUCCESS_SIGNAL_TIMEOUT
             )
             return response.status_code == 200
         except requests.RequestException as e:
             logger.error(f"Error sending success signal: {e}")
             return False
+
+    def enqueue_success_signal(self, fingerprint: str, context: Dict[str, Any]) -> Future:
+        """Send a success signal from a background thread.
+
+        Returns immediately with a Future resolving to the result of
+        ``send_success_signal``. If ``buffer_size`` signals are already
+        pending, or after ``close``, the signal is dropped and the Future
+        resolves to False.
+        """
+        with self._signals_lock:
+            if len(self._pending_signals) >= self.config.buffer_size:
+                logger.warning("Success signal queue is full, dropping success signal")
+                return _resolved(False)
+            try:
+                future = self._executor.submit(self.send_success_signal, fingerprint, context)
+            except RuntimeError:
+                # The executor refuses new work once close() has shut it down
+                logger.warning("Transport is closed, dropping success signal")
+                return _resolved(False)
+            self._pending_signals.add(future)
+        future.add_done_callback(self._pending_signals.discard)
+        return future
+
+    def close(self, timeout: float = CLOSE_TIMEOUT):
+        """Flush queued events and release pooled connections.
+
+        Gives queued events and success signals up to ``timeout`` seconds
+        in total; whatever is still pending after that is dropped.
+        """
+        deadline = time.monotonic() + timeout
+        self._batch_buffer.close(timeout)
+        self._executor.shutdown(wait=False)
+        with self._signals_lock:
+            pending = list(self._pending_signals)
+        _, not_done = wait(pending, timeout=max(deadline - time.monotonic(), 0))
+        dropped = sum(future.cancel() for future in not_done)
+        if dropped:
+            logger.warning(f"Transport close timed out, dropping {dropped} success signals")
+        self.session.close()
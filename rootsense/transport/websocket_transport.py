@@ -4,16 +4,29 @@ import asyncio
 import json
 import logging
 import threading
-from typing import Optional
+from typing import Any, Callable, Optional
 
 try:
     import websockets
 except ImportError:
     websockets = None
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _loads(message):
+    """Parse a JSON message, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(message)
+    return json.loads(message)
+
+
 class WebSocketTransport:
     """WebSocket transport for real-time data streaming."""
 
@@ -21,8 +34,14 @@ class WebSocketTransport:
         self.config = config
         self._ws = None
         self._loop = None
+        self._task = None
         self._thread = None
         self._stop_event = threading.Event()
+        self._handlers = []
+
+    def add_handler(self, handler: Callable[[Any], None]):
+        """Register a callback invoked with each parsed incoming message."""
+        self._handlers.append(handler)
 
     def start(self):
         """Start WebSocket connection in background thread."""
@@ -39,51 +58,72 @@ class WebSocketTransport:
         asyncio.set_event_loop(self._loop)
        
         try:
-            self._loop.run_until_complete(self._connect_and_listen())
+            self._task = self._loop.create_task(self._connect_and_listen())
+            # close() may have run before the task existed
+            if self._stop_event.is_set():
+                self._task.cancel()
+            self._loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
             logger.error(f"WebSocket error: {e}")
         finally:
             self._loop.close()
 
     async def _connect_and_listen(self):
-        """Connect to WebSocket and listen for events."""
+        """Connect to WebSocket and listen for events until cancelled."""
         ws_url = self.config.base_url.replace("https://", "wss://").replace("http://", "ws://")
         ws_url = f"{ws_url}/stream?project_id={self.config.project_id}"
        
         try:
             async with websockets.connect(
                 ws_url,
-                extra_headers={"X-API-Key": self.config.api_key}
+                extra_headers={"X-API-Key": self.config.api_key},
+                compression=None,  # messages are small, deflate costs more than it saves
+                ping_interval=20,
+                ping_timeout=20,
+                max_size=2 ** 20,
+                max_queue=64
             ) as websocket:
                 self._ws = websocket
                
-                while not self._stop_event.is_set():
-                    try:
-                        message = await asyncio.wait_for(
-                            websocket.recv(),
-                            timeout=1.0
-                        )
-                        self._handle_message(message)
-                    except asyncio.TimeoutError:
-                        continue
-                    except websockets.exceptions.ConnectionClosed:
-                        break
+                async for message in websocket:
+                    self._handle_message(message)
                        
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.error(f"WebSocket connection error: {e}")
 
     def _handle_message(self, message: str):
         """Handle incoming WebSocket message."""
+        # Only pay for parsing when something will use the result
+        if not (self.config.debug or self._handlers):
+            return
+       
         try:
-            data = json.loads(message)
-            # Handle different message types
-            if self.config.debug:
-                logger.debug(f"Received WebSocket message: {data}")
-        except json.JSONDecodeError as e:
+            data = _loads(message)
+        except ValueError as e:
             logger.error(f"Failed to parse WebSocket message: {e}")
+            return
+       
+        if self.config.debug:
+            logger.debug(f"Received WebSocket message: {data}")
+       
+        for handler in self._handlers:
+            try:
+                handler(data)
+            except Exception as e:
+                logger.error(f"WebSocket message handler failed: {e}")
 
     def close(self):
         """Close WebSocket connection."""
         self._stop_event.set()
+        if self._loop and self._task:
+            try:
+                self._loop.call_soon_threadsafe(self._task.cancel)
+            except RuntimeError:
+                # Loop already closed
+                pass
         if self._thread:
             self._thread.join(timeout=2)
@@ -1,8 +1,25 @@
 """PII sanitization utilities."""
 
+import functools
+import logging
 import re
+import threading
 from typing import Any, Dict, List
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 
 class Sanitizer:
     """Sanitizes sensitive data from requests and responses."""
@@ -14,6 +31,11 @@ class Sanitizer:
         "credit_card", "card_number", "cvv", "ssn",
         "private_key", "access_token", "refresh_token"
     ]
+
+    # Fallback when pyahocorasick is missing: one regex instead of a substring test per key
+    SENSITIVE_KEY_PATTERN = re.compile("|".join(map(re.escape, SENSITIVE_KEYS)))
+
+    SENSITIVE_HEADERS = frozenset(["authorization", "cookie", "x-api-key", "x-auth-token"])
    
     # Regex patterns for PII
     EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
@@ -21,6 +43,21 @@ class Sanitizer:
     SSN_PATTERN = re.compile(r'\b\d{3}-\d{2}-\d{4}\b')
     CREDIT_CARD_PATTERN = re.compile(r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b')
 
+    # All PII patterns as one alternation so strings are scanned in a single pass
+    PII_PATTERN = re.compile("|".join(
+        f"(?P<{name}>{pattern.pattern})" for name, pattern in (
+            ("email", EMAIL_PATTERN),
+            ("phone", PHONE_PATTERN),
+            ("ssn", SSN_PATTERN),
+            ("credit_card", CREDIT_CARD_PATTERN),
+        )
+    ))
+    PII_MASKS = {
+        "phone": "XXX-XXX-XXXX",
+        "ssn": "XXX-XX-XXXX",
+        "credit_card": "XXXX-XXXX-XXXX-XXXX",
+    }
+
     def __init__(self, sanitize_pii: bool = True):
         """Initialize sanitizer.
         
@@ -28,64 +65,132 @@ class Sanitizer:
             sanitize_pii: Whether to sanitize PII (default: True)
         """
         self.sanitize_pii = sanitize_pii
+        self._pii_database = self._build_pii_database() if HYPERSCAN_AVAILABLE else None
+        self._local = threading.local()
+        self._key_automaton = self._build_key_automaton() if AHOCORASICK_AVAILABLE else None
+        
+        # The same keys show up in nearly every event, so memoize the lookup
+        self._is_sensitive_key = functools.lru_cache(maxsize=4096)(self._is_sensitive_key)
+
+    def _build_key_automaton(self):
+        """Build an Aho-Corasick automaton matching any of SENSITIVE_KEYS."""
+        automaton = ahocorasick.Automaton()
+        for sensitive in self.SENSITIVE_KEYS:
+            automaton.add_word(sensitive, sensitive)
+        automaton.make_automaton()
+        return automaton
+
+    def _build_pii_database(self):
+        """Compile the PII patterns into a Hyperscan database for fast pre-screening."""
+        try:
+            database = hyperscan.Database()
+            patterns = [self.EMAIL_PATTERN, self.PHONE_PATTERN, self.SSN_PATTERN, self.CREDIT_CARD_PATTERN]
+            database.compile(
+                expressions=[p.pattern.encode() for p in patterns],
+                ids=list(range(len(patterns))),
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns)
+            )
+            return database
+        except Exception as e:
+            logger.debug(f"Hyperscan unavailable, using regex PII scanning: {e}")
+            return None
+
+    def _may_contain_pii(self, text: str) -> bool:
+        """Check in one Hyperscan pass whether any PII pattern matches.
+
+        Only ASCII text is pre-screened; Python's digit and word-boundary
+        classes are Unicode-aware, so anything else is left to the regex.
+        """
+        if self._pii_database is None or not text.isascii():
+            return True
+        
+        # Scratch space is per-thread; Hyperscan forbids sharing it between scans
+        scratch = getattr(self._local, 'scratch', None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self._pii_database)
+        
+        try:
+            self._pii_database.scan(
+                text.encode(),
+                match_event_handler=lambda *args: True,  # stop at first match
+                scratch=scratch
+            )
+        except hyperscan.ScanTerminated:
+            return True
+        return False
 
     def sanitize_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Sanitize dictionary recursively."""
+        """Sanitize dictionary recursively.
+
+        Copy-on-write: dicts and lists with nothing to redact are returned
+        as-is, so clean payloads are not copied at all.
+        """
         if not isinstance(data, dict) or not self.sanitize_pii:
             return data
        
-        sanitized = {}
+        sanitized = None
         for key, value in data.items():
             if self._is_sensitive_key(key):
-                sanitized[key] = "[REDACTED]"
+                new_value = "[REDACTED]"
             elif isinstance(value, dict):
-                sanitized[key] = self.sanitize_dict(value)
+                new_value = self.sanitize_dict(value)
             elif isinstance(value, list):
-                sanitized[key] = [self.sanitize_dict(item) if isinstance(item, dict) else item for item in value]
+                new_value = self._sanitize_list(value)
             elif isinstance(value, str):
-                sanitized[key] = self._sanitize_string(value)
+                new_value = self._sanitize_string(value)
             else:
-                sanitized[key] = value
+                continue
+            
+            if new_value is not value:
+                if sanitized is None:
+                    sanitized = dict(data)
+                sanitized[key] = new_value
        
-        return sanitized
+        return data if sanitized is None else sanitized
+
+    def _sanitize_list(self, items: List[Any]) -> List[Any]:
+        """Sanitize dicts inside a list, copying the list only if one changed."""
+        sanitized = None
+        for index, item in enumerate(items):
+            if isinstance(item, dict):
+                new_item = self.sanitize_dict(item)
+                if new_item is not item:
+                    if sanitized is None:
+                        sanitized = list(items)
+                    sanitized[index] = new_item
+        
+        return items if sanitized is None else sanitized
 
     def sanitize_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
         """Sanitize HTTP headers."""
         if not self.sanitize_pii:
             return headers
-            
-        sanitized = {}
-        for key, value in headers.items():
-            key_lower = key.lower()
-            if key_lower in ['authorization', 'cookie', 'x-api-key', 'x-auth-token']:
-                sanitized[key] = "[REDACTED]"
-            else:
-                sanitized[key] = value
-        return sanitized
+        
+        sensitive = self.SENSITIVE_HEADERS
+        return {
+            key: "[REDACTED]" if key.lower() in sensitive else value
+            for key, value in headers.items()
+        }
 
     def _is_sensitive_key(self, key: str) -> bool:
         """Check if key is sensitive."""
         key_lower = key.lower()
-        return any(sensitive in key_lower for sensitive in self.SENSITIVE_KEYS)
+        if self._key_automaton is not None:
+            return next(self._key_automaton.iter(key_lower), None) is not None
+        return self.SENSITIVE_KEY_PATTERN.search(key_lower) is not None
 
     def _sanitize_string(self, text: str) -> str:
         """Sanitize PII patterns in strings."""
-        if not text or not self.sanitize_pii:
+        if not text or not self.sanitize_pii or not self._may_contain_pii(text):
             return text
        
-        # Mask email addresses
-        text = self.EMAIL_PATTERN.sub(lambda m: self._mask_email(m.group()), text)
-       
-        # Mask phone numbers
-        text = self.PHONE_PATTERN.sub("XXX-XXX-XXXX", text)
-       
-        # Mask SSN
-        text = self.SSN_PATTERN.sub("XXX-XX-XXXX", text)
-       
-        # Mask credit cards
-        text = self.CREDIT_CARD_PATTERN.sub("XXXX-XXXX-XXXX-XXXX", text)
-       
-        return text
+        return self.PII_PATTERN.sub(self._mask_match, text)
+
+    def _mask_match(self, match: "re.Match") -> str:
+        """Return the mask for whichever PII pattern matched."""
+        if match.lastgroup == "email":
+            return self._mask_email(match.group())
+        return self.PII_MASKS[match.lastgroup]
 
     def _mask_email(self, email: str) -> str:
         """Mask email address."""
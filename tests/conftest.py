@@ -1,6 +1,8 @@
 """Pytest configuration and fixtures."""
 
 import pytest
+
+from rootsense.config import Config
 from rootsense.context import clear_context
 
 
@@ -10,3 +12,24 @@ def clean_context():
     clear_context()
     yield
     clear_context()
+
+
+@pytest.fixture
+def mock_config():
+    """Create a real config for client tests; cheaper than a spec'd Mock."""
+    return Config(
+        api_key="test-key",
+        project_id="test-project",
+        debug=True,
+        sanitize_pii=True,
+        enable_auto_instrumentation=False
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_exception():
+    """Create sample exception once; tests only read it."""
+    try:
+        raise ValueError("Test error")
+    except ValueError as e:
+        return e
@@ -1,88 +1,85 @@
 """Tests for RootSense client."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
+import rootsense
 from rootsense.client import RootSenseClient
-from rootsense.config import Config
+
+
+@pytest.fixture(scope="class")
+def _class_patches():
+    """Patch the client's transport and collector once per test class."""
+    with patch('rootsense.client.HttpTransport') as transport, \
+         patch('rootsense.client.ErrorCollector') as collector:
+        yield SimpleNamespace(transport=transport, collector=collector)
+
+
+@pytest.fixture
+def sample_message():
+    """Message passed to capture_message."""
+    return "Test message"
 
 
 class TestRootSenseClient:
-    @pytest.fixture
-    def mock_config(self):
-        """Create mock config."""
-        config = Mock(spec=Config)
-        config.sanitize_pii = True
-        config.debug = True
-        config.project_id = "test-project"
-        config.enable_auto_instrumentation = False
-        return config
-
-    @pytest.fixture
-    def sample_exception(self):
-        """Create sample exception."""
-        try:
-            raise ValueError("Test error")
-        except ValueError as e:
-            return e
+    @pytest.fixture(autouse=True)
+    def patches(self, _class_patches):
+        """Reset the shared mocks so each test starts clean."""
+        _class_patches.transport.reset_mock(return_value=True, side_effect=True)
+        _class_patches.collector.reset_mock(return_value=True, side_effect=True)
+        return _class_patches
 
     def test_client_initialization(self, mock_config):
         """Test client initializes correctly."""
-        with patch('rootsense.client.HttpTransport'), \
-             patch('rootsense.client.ErrorCollector'):
-            
-            client = RootSenseClient(mock_config)
-            
-            assert client.config == mock_config
-            assert client._initialized is True
+        client = RootSenseClient(mock_config)
+
+        assert client.config == mock_config
+        assert client._initialized is True
+
+    @pytest.mark.parametrize("method,arg_fixture,kwargs,collector_args,event_id", [
+        (
+            "capture_exception", "sample_exception",
+            {"context": {"service": "api"}}, ({"service": "api"},), "event-123"
+        ),
+        ("capture_message", "sample_message", {"level": "error"}, ("error", None), "event-456"),
+    ])
+    def test_capture(
+        self, request, mock_config, patches, method, arg_fixture, kwargs, collector_args, event_id
+    ):
+        """Test captures are delegated to the error collector."""
+        arg = request.getfixturevalue(arg_fixture)
+        collector_method = getattr(patches.collector.return_value, method)
+        collector_method.return_value = event_id
+
+        client = RootSenseClient(mock_config)
 
-    def test_capture_exception(self, mock_config, sample_exception):
-        """Test capturing exceptions."""
-        with patch('rootsense.client.HttpTransport'), \
-             patch('rootsense.client.ErrorCollector') as mock_collector:
-            
-            mock_instance = mock_collector.return_value
-            mock_instance.capture_exception.return_value = "event-123"
-            
-            client = RootSenseClient(mock_config)
-            event_id = client.capture_exception(sample_exception)
-            
-            assert event_id == "event-123"
-            mock_collector.return_value.capture_exception.assert_called_once()
-
-    def test_capture_message(self, mock_config):
-        """Test capturing messages."""
-        with patch('rootsense.client.HttpTransport'), \
-             patch('rootsense.client.ErrorCollector') as mock_collector:
-            
-            mock_instance = mock_collector.return_value
-            mock_instance.capture_message.return_value = "event-456"
-            
-            client = RootSenseClient(mock_config)
-            event_id = client.capture_message("Test message", level="error")
-            
-            assert event_id == "event-456"
-            mock_collector.return_value.capture_message.assert_called_once()
-
-    def test_client_close(self, mock_config):
+        assert getattr(client, method)(arg, **kwargs) == event_id
+        # The client forwards level and context positionally
+        collector_method.assert_called_once_with(arg, *collector_args)
+
+    def test_client_close(self, mock_config, patches):
         """Test client cleanup."""
-        with patch('rootsense.client.HttpTransport'), \
-             patch('rootsense.client.ErrorCollector') as mock_collector:
-            
-            mock_collector.return_value.flush = Mock()
-            
-            client = RootSenseClient(mock_config)
-            client.close()
-            
-            assert client._initialized is False
-            mock_collector.return_value.flush.assert_called_once()
+        patches.collector.return_value.flush = Mock()
+
+        client = RootSenseClient(mock_config)
+        client.close()
+
+        assert client._initialized is False
+        patches.collector.return_value.flush.assert_called_once()
+        patches.transport.return_value.close.assert_called_once()
 
     def test_context_manager(self, mock_config):
         """Test client works as context manager."""
-        with patch('rootsense.client.HttpTransport'), \
-             patch('rootsense.client.ErrorCollector'):
-            
-            with RootSenseClient(mock_config) as client:
-                assert client._initialized is True
-            
-            assert client._initialized is False
+        with RootSenseClient(mock_config) as client:
+            assert client._initialized is True
+
+        assert client._initialized is False
+
+
+class TestGetClient:
+    def test_get_client_without_init(self, monkeypatch):
+        """Test get_client returns None before init is called."""
+        monkeypatch.setattr(rootsense, "_client", None)
+
+        assert rootsense.get_client() is None
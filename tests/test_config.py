@@ -1,44 +1,87 @@
 """Tests for configuration parsing."""
 
 import pytest
-import os
 from rootsense.config import Config
 
 
 class TestConfig:
     """Test configuration parsing."""
 
-    def test_separate_params(self):
-        """Test initialization with separate parameters."""
-        config = Config(
-            api_key="test-key",
-            project_id="test-project",
-            backend_url="https://api.test.com"
-        )
-        
-        assert config.api_key == "test-key"
-        assert config.project_id == "test-project"
-        assert config.backend_url == "https://api.test.com"
-        assert config.events_endpoint == "https://api.test.com/v1/projects/test-project/events"
+    @pytest.mark.parametrize("kwargs,expected", [
+        pytest.param(
+            {
+                "api_key": "test-key",
+                "project_id": "test-project",
+                "backend_url": "https://api.test.com"
+            },
+            {
+                "api_key": "test-key",
+                "project_id": "test-project",
+                "backend_url": "https://api.test.com",
+                "events_endpoint": "https://api.test.com/v1/projects/test-project/events"
+            },
+            id="separate_params"
+        ),
+        pytest.param(
+            {"connection_string": "rootsense://test-key@api.test.com/test-project"},
+            {
+                "api_key": "test-key",
+                "project_id": "test-project",
+                "backend_url": "https://api.test.com"
+            },
+            id="connection_string"
+        ),
+        pytest.param(
+            {"api_key": "test-key", "project_id": "test-project"},
+            {
+                "environment": "production",
+                "sample_rate": 1.0,
+                "debug": False,
+                "sanitize_pii": True,
+                "max_breadcrumbs": 100,
+                "buffer_size": 1000,
+                "batch_interval_ms": 1000,
+                "max_batch_size": 100,
+                "pool_size": 32
+            },
+            id="defaults"
+        ),
+        pytest.param(
+            {
+                "api_key": "test-key",
+                "project_id": "test-project",
+                "environment": "staging",
+                "sample_rate": 0.5,
+                "debug": True,
+                "sanitize_pii": False,
+                "max_breadcrumbs": 50,
+                "buffer_size": 500
+            },
+            {
+                "environment": "staging",
+                "sample_rate": 0.5,
+                "debug": True,
+                "sanitize_pii": False,
+                "max_breadcrumbs": 50,
+                "buffer_size": 500
+            },
+            id="custom_options"
+        ),
+    ])
+    def test_config_values(self, kwargs, expected):
+        """Test configuration values for each way of building a Config."""
+        config = Config(**kwargs)
 
-    def test_connection_string(self):
-        """Test initialization with connection string."""
-        config = Config(
-            connection_string="rootsense://test-key@api.test.com/test-project"
-        )
-        
-        assert config.api_key == "test-key"
-        assert config.project_id == "test-project"
-        assert config.backend_url == "https://api.test.com"
+        assert {attr: getattr(config, attr) for attr in expected} == expected
 
     def test_env_vars(self, monkeypatch):
         """Test initialization from environment variables."""
         monkeypatch.setenv("ROOTSENSE_API_KEY", "env-key")
         monkeypatch.setenv("ROOTSENSE_PROJECT_ID", "env-project")
         monkeypatch.setenv("ROOTSENSE_BACKEND_URL", "https://api.env.com")
-        
+
         config = Config()
-        
+
         assert config.api_key == "env-key"
         assert config.project_id == "env-project"
         assert config.backend_url == "https://api.env.com"
@@ -53,38 +96,14 @@ class TestConfig:
         with pytest.raises(ValueError, match="project_id is required"):
             Config(api_key="test-key")
 
+    @pytest.mark.parametrize("option", ["batch_interval_ms", "max_batch_size"])
+    @pytest.mark.parametrize("value", [0, -1])
+    def test_invalid_batch_options(self, option, value):
+        """Test that non-positive batching options raise error."""
+        with pytest.raises(ValueError, match=f"{option} must be greater than 0"):
+            Config(api_key="test-key", project_id="test-project", **{option: value})
+
     def test_invalid_connection_string(self):
         """Test that invalid connection string raises error."""
         with pytest.raises(ValueError, match="Invalid connection string format"):
             Config(connection_string="invalid-format")
-
-    def test_defaults(self):
-        """Test default configuration values."""
-        config = Config(api_key="test-key", project_id="test-project")
-        
-        assert config.environment == "production"
-        assert config.sample_rate == 1.0
-        assert config.debug is False
-        assert config.sanitize_pii is True
-        assert config.max_breadcrumbs == 100
-        assert config.buffer_size == 1000
-
-    def test_custom_options(self):
-        """Test custom configuration options."""
-        config = Config(
-            api_key="test-key",
-            project_id="test-project",
-            environment="staging",
-            sample_rate=0.5,
-            debug=True,
-            sanitize_pii=False,
-            max_breadcrumbs=50,
-            buffer_size=500
-        )
-        
-        assert config.environment == "staging"
-        assert config.sample_rate == 0.5
-        assert config.debug is True
-        assert config.sanitize_pii is False
-        assert config.max_breadcrumbs == 50
-        assert config.buffer_size == 500
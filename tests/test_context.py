@@ -11,8 +11,6 @@ class TestContext:
 
     def test_set_and_get_context(self):
         """Test setting and getting context."""
-        clear_context()
-        
         set_context("request", {"url": "/test"})
         context = get_context()
         
@@ -20,8 +18,6 @@ class TestContext:
 
     def test_set_user(self):
         """Test setting user context."""
-        clear_context()
-        
         set_user(user_id="123", email="test@example.com")
         context = get_context()
         
@@ -30,8 +26,6 @@ class TestContext:
 
     def test_set_tag(self):
         """Test setting tags."""
-        clear_context()
-        
         set_tag("environment", "production")
         set_tag("version", "1.0.0")
         context = get_context()
@@ -41,8 +35,6 @@ class TestContext:
 
     def test_breadcrumbs(self):
         """Test breadcrumb tracking."""
-        clear_context()
-        
         push_breadcrumb(message="User clicked button", category="navigation", button_id="submit")
         push_breadcrumb(message="API call", category="http", url="/api/users")
         
@@ -1,49 +1,111 @@
 """Tests for error collection."""
 
 import pytest
-import time
-from unittest.mock import Mock, MagicMock, patch
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 from rootsense.config import Config
 from rootsense.collectors.error_collector import ErrorCollector
 from rootsense.context import set_context, set_user, set_tag
 
 
-class TestErrorCollector:
-    """Test error collector functionality."""
+@pytest.fixture(scope="module")
+def config():
+    """Create test config."""
+    return Config(
+        api_key="test-key",
+        project_id="test-project",
+        debug=True
+    )
 
-    @pytest.fixture
-    def config(self):
-        """Create test config."""
-        return Config(
-            api_key="test-key",
-            project_id="test-project",
-            debug=True
-        )
 
-    @pytest.fixture
-    def transport(self):
-        """Create mock transport."""
-        return Mock()
+class _StubTransport:
+    """Record what the collector hands to the transport."""
 
-    @pytest.fixture
-    def collector(self, config, transport):
-        """Create error collector."""
-        collector = ErrorCollector(config, transport)
-        collector.start()
-        yield collector
-        collector.stop()
+    def __init__(self):
+        self.sent = []
+        self.success_signals = []
+
+    def send_events(self, batch):
+        self.sent.append(batch)
+        return True
+
+    def enqueue_success_signal(self, fingerprint, context):
+        self.success_signals.append((fingerprint, context))
+
+    def reset(self):
+        self.sent.clear()
+        self.success_signals.clear()
+
+
+@pytest.fixture(scope="module")
+def transport():
+    """Create stub transport."""
+    return _StubTransport()
+
+
+@pytest.fixture(scope="module")
+def collector(config, transport):
+    """Create one running error collector for the module."""
+    collector = ErrorCollector(config, transport)
+    collector.start()
+    yield collector
+    collector.stop()
+
+
+@pytest.fixture(autouse=True)
+def _reset_collector(transport, collector):
+    """Return the shared transport and collector to a clean state for each test."""
+    transport.reset()
+    metrics_enabled = collector._metrics_enabled
+    yield
+    collector._metrics_enabled = metrics_enabled
+    with collector._queue.mutex:
+        collector._queue.queue.clear()
+    with collector._lock:
+        collector._recent_errors.clear()
+        collector._recent_successes.clear()
+
+
+@pytest.fixture
+def mock_registry():
+    """Replace the Prometheus registry the collector reads metrics from."""
+    with patch("rootsense.collectors.error_collector.REGISTRY") as registry, \
+         patch("rootsense.collectors.error_collector.PROMETHEUS_AVAILABLE", True):
+        yield registry
+
+
+def wait_for_worker(collector, timeout=1.0):
+    """Block until the worker has taken every queued event.
+
+    Queue.get() notifies ``not_full``, so this waits on that condition
+    instead of sleeping.
+    """
+    q = collector._queue
+    with q.not_full:
+        return q.not_full.wait_for(lambda: not q.queue, timeout)
 
-    def test_capture_exception(self, collector):
+
+class TestErrorCollector:
+    """Test error collector functionality."""
+
+    def test_capture_exception(self, collector, sample_exception):
         """Test exception capture."""
-        try:
-            1 / 0
-        except Exception as e:
-            event_id = collector.capture_exception(e)
+        event_id = collector.capture_exception(sample_exception)
             
         assert event_id is not None
-        time.sleep(0.1)  # Allow worker to process
+        assert wait_for_worker(collector)
 
-    def test_capture_exception_with_context(self, collector):
+    def test_capture_exception_outside_except_block(self, config, transport, sample_exception):
+        """Test the stack trace comes from the exception, not the handler being run."""
+        collector = ErrorCollector(config, transport)
+        
+        collector.capture_exception(sample_exception)
+        event = collector._queue.get_nowait()
+        
+        assert "ValueError: Test error" in event["stack_trace"]
+
+    def test_capture_exception_with_context(self, collector, sample_exception):
         """Test exception capture with context."""
         context = {
             "service": "api",
@@ -51,10 +113,7 @@ class TestErrorCollector:
             "method": "POST"
         }
         
-        try:
-            raise ValueError("Test error")
-        except Exception as e:
-            event_id = collector.capture_exception(e, context=context)
+        event_id = collector.capture_exception(sample_exception, context=context)
             
         assert event_id is not None
 
@@ -63,39 +122,57 @@ class TestErrorCollector:
         event_id = collector.capture_message("Test message", level="info")
         assert event_id is not None
 
-    def test_event_enrichment(self, collector):
+    def test_event_enrichment(self, collector, sample_exception):
         """Test that events are enriched with context."""
         # Set context
         set_user({"id": "123", "email": "test@example.com"})
         set_tag("environment", "test")
         set_context("request", {"url": "/test"})
         
-        try:
-            raise ValueError("Test")
-        except Exception as e:
-            event_id = collector.capture_exception(e)
+        event_id = collector.capture_exception(sample_exception)
             
         assert event_id is not None
-        time.sleep(0.1)
+        assert wait_for_worker(collector)
 
-    def test_fingerprint_generation(self, collector):
+    def test_fingerprint_generation(self, collector, sample_exception):
         """Test fingerprint generation for grouping."""
         context1 = {"service": "api", "endpoint": "/users"}
         context2 = {"service": "api", "endpoint": "/users"}
         context3 = {"service": "api", "endpoint": "/posts"}
         
-        try:
-            raise ValueError("Test")
-        except Exception as e:
-            fp1 = collector._generate_fingerprint(e, context1)
-            fp2 = collector._generate_fingerprint(e, context2)
-            fp3 = collector._generate_fingerprint(e, context3)
+        fp1 = collector._generate_fingerprint(sample_exception, context1)
+        fp2 = collector._generate_fingerprint(sample_exception, context2)
+        fp3 = collector._generate_fingerprint(sample_exception, context3)
         
         # Same error+service+endpoint should have same fingerprint
         assert fp1 == fp2
         # Different endpoint should have different fingerprint
         assert fp1 != fp3
 
+    def test_success_after_error_signals_resolution(self, collector, transport):
+        """Test a success following an error queues a success signal."""
+        fingerprint = collector._generate_success_fingerprint("/users")
+        collector._recent_errors[fingerprint] = datetime.utcnow()
+        
+        collector.capture_success("/users", method="POST")
+        
+        assert len(transport.success_signals) == 1
+        signal_fingerprint, signal_context = transport.success_signals[0]
+        assert signal_fingerprint == fingerprint
+        assert signal_context["method"] == "POST"
+        assert fingerprint not in collector._recent_errors
+
+    def test_auto_resolution_tracking_is_bounded(self, collector, monkeypatch):
+        """Test fingerprint tracking evicts the least recently seen entries."""
+        monkeypatch.setattr(collector, "MAX_TRACKED_FINGERPRINTS", 3)
+        
+        for endpoint in ["/a", "/b", "/c", "/d"]:
+            collector.capture_success(endpoint)
+        
+        assert len(collector._recent_successes) == 3
+        assert collector._generate_success_fingerprint("/a") not in collector._recent_successes
+        assert collector._generate_success_fingerprint("/d") in collector._recent_successes
+
 
 
     def test_buffer_overflow(self, config, transport):
@@ -119,40 +196,43 @@ class TestErrorCollector:
         collector.flush(timeout=1)
         # Should have sent events
 
-    @patch("rootsense.collectors.error_collector.REGISTRY")
-    @patch("rootsense.collectors.error_collector.PROMETHEUS_AVAILABLE", True)
     def test_collect_prometheus_metrics(self, mock_registry, collector):
         """Test Prometheus metric collection."""
         # Ensure metrics are enabled
         collector._metrics_enabled = True
-        # Mock metric family
-        mock_metric = MagicMock()
-        mock_metric.name = "test_metric"
-        mock_metric.documentation = "Test doc"
-        mock_metric.unit = "1"
-        
-        mock_sample = MagicMock()
-        mock_sample.name = "test_metric"
-        mock_sample.labels = {"label": "value"}
-        mock_sample.value = 10.0
-        
-        mock_metric.samples = [mock_sample]
-        
-        mock_registry.collect.return_value = [mock_metric]
+        # Metric family as returned by REGISTRY.collect()
+        metric = SimpleNamespace(
+            name="test_metric",
+            type="gauge",
+            documentation="Test doc",
+            unit="1",
+            samples=[
+                SimpleNamespace(
+                    name="test_metric",
+                    labels={"label": "value"},
+                    value=10.0,
+                    timestamp=None
+                )
+            ]
+        )
+        mock_registry.collect.return_value = [metric]
         
         # Force metric collection
         events = collector._collect_prometheus_metrics()
         
         assert len(events) == 1
         assert events[0]["type"] == "metric"
-        assert events[0]["name"] == "test_metric"
-        assert events[0]["data_points"][0]["value"] == 10.0
-        assert events[0]["data_points"][0]["attributes"]["label"] == "value"
+        assert events[0]["metric_type"] == "gauge"
+        assert events[0]["metric_name"] == "test_metric"
+        assert events[0]["sample_name"] == "test_metric"
+        assert events[0]["value"] == 10.0
+        assert events[0]["labels"]["label"] == "value"
 
-    @patch("rootsense.collectors.error_collector.REGISTRY")
-    @patch("rootsense.collectors.error_collector.PROMETHEUS_AVAILABLE", True)
-    def test_metrics_on_stop(self, mock_registry, collector, transport):
+    def test_metrics_on_stop(self, mock_registry, config, transport):
         """Test that metrics are collected when stopping."""
+        # Stops its collector, so it can't use the shared one
+        collector = ErrorCollector(config, transport)
+        collector.start()
         collector._metrics_enabled = True
         collector.batch_send_duration = MagicMock()
         
@@ -162,12 +242,11 @@ class TestErrorCollector:
         mock_metric.samples = [MagicMock(value=1.0, labels={})]
         mock_registry.collect.return_value = [mock_metric]
         
-        time.sleep(0.1)
         collector.stop()
         
         # Should have sent batch with metrics
-        assert transport.send_events.called
-        batch = transport.send_events.call_args[0][0]
+        assert transport.sent
+        batch = transport.sent[-1]
         
         # Check for metric event in batch
         has_metric = any(e.get("type") == "metric" for e in batch)
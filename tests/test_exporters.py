@@ -1,24 +1,46 @@
 """Tests for OpenTelemetry exporters."""
 
 import pytest
-from unittest.mock import Mock, MagicMock
-from opentelemetry.sdk.trace import ReadableSpan
-from opentelemetry.trace import Status, StatusCode
-from opentelemetry.sdk.metrics.export import MetricsData, ResourceMetrics, ScopeMetrics, Metric
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Optional
+from unittest.mock import Mock
+from opentelemetry.trace import StatusCode
 from opentelemetry.sdk.resources import Resource
 
+from rootsense.collectors.error_collector import ErrorCollector
 from rootsense.instrumentation.exporters import RootSenseSpanExporter, RootSenseMetricExporter
+from rootsense.transport.http_transport import HttpTransport
+
+
+@dataclass
+class MockContext:
+    trace_id: int = 12345678901234567890123456789012
+    span_id: int = 1234567890123456
+
+
+@dataclass
+class MockSpan:
+    name: str
+    status: Any
+    attributes: dict
+    context: MockContext = field(default_factory=MockContext)
+    parent: Optional[MockContext] = None
+    start_time: int = 1000
+    end_time: int = 2000
+    events: list = field(default_factory=list)
+
 
 class TestRootSenseSpanExporter:
     """Test span exporter."""
 
     @pytest.fixture
     def error_collector(self):
-        return Mock()
+        return Mock(spec_set=ErrorCollector)
 
     @pytest.fixture
     def http_transport(self):
-        return Mock()
+        return Mock(spec_set=HttpTransport)
 
     @pytest.fixture
     def exporter(self, error_collector, http_transport):
@@ -26,29 +48,16 @@ class TestRootSenseSpanExporter:
 
     def test_export_spans(self, exporter, http_transport):
         """Test exporting spans."""
-        class MockContext:
-            trace_id = 12345678901234567890123456789012
-            span_id = 1234567890123456
-            
-        class MockSpan:
-            name = "test-span"
-            context = MockContext()
-            parent = None
-            start_time = 1000
-            end_time = 2000
-            status = Mock()
-            attributes = {"http.method": "GET"}
-            events = []
-            
-        span = MockSpan()
-        span.status.is_ok = False
-        span.status.status_code = StatusCode.ERROR
+        span = MockSpan(
+            name="test-span",
+            status=Mock(is_ok=False, status_code=StatusCode.ERROR),
+            attributes={"http.method": "GET"}
+        )
 
         result = exporter.export([span])
 
-        assert http_transport.send_events.called
-        args = http_transport.send_events.call_args[0]
-        events = args[0]
+        http_transport.enqueue_events.assert_called_once()
+        (events,) = http_transport.enqueue_events.call_args.args
         assert len(events) == 1
         assert events[0]["type"] == "span"
         assert events[0]["name"] == "test-span"
@@ -64,43 +73,39 @@ class TestRootSenseSpanExporter:
         exporter.export([span])
 
         # Should not send event
-        assert not http_transport.send_events.called
+        http_transport.enqueue_events.assert_not_called()
 
     def test_track_success(self, exporter, http_transport):
         """Test that successful operations trigger success signal."""
-        class MockContext:
-            trace_id = 12345678901234567890123456789012
-            span_id = 1234567890123456
-            
-        class MockSpan:
-            name = "GET /api/users"
-            context = MockContext()
-            status = Mock()
-            attributes = {"http.method": "GET", "http.route": "/api/users"}
-            parent = None
-            start_time = 1000
-            end_time = 2000
-            events = []
-            
-        span = MockSpan()
-        span.status.is_ok = True
+        span = MockSpan(
+            name="GET /api/users",
+            status=Mock(is_ok=True),
+            attributes={"http.method": "GET", "http.route": "/api/users"}
+        )
         
         exporter.export([span])
 
         # Should send success signal
             
-        assert http_transport.send_success_signal.called
-        args = http_transport.send_success_signal.call_args
-        fingerprint = args[0][0]
+        http_transport.enqueue_success_signal.assert_called_once()
+        fingerprint, _ = http_transport.enqueue_success_signal.call_args.args
         assert "http:GET:/api/users" in fingerprint
 
 
+    def test_force_flush(self, exporter, http_transport):
+        """Test force_flush sends queued events through the transport."""
+        http_transport.flush.return_value = True
+
+        assert exporter.force_flush(timeout_millis=2000) is True
+        http_transport.flush.assert_called_once_with(timeout=2.0)
+
+
 class TestRootSenseMetricExporter:
     """Test metric exporter."""
 
     @pytest.fixture
     def http_transport(self):
-        return Mock()
+        return Mock(spec_set=HttpTransport)
 
     @pytest.fixture
     def exporter(self, http_transport):
@@ -108,35 +113,36 @@ class TestRootSenseMetricExporter:
 
     def test_export_metrics(self, exporter, http_transport):
         """Test exporting metrics."""
-        # Mock complex OTel metric structure
-        metric_data = MagicMock()
-        
-        resource_metrics = MagicMock()
-        resource_metrics.resource = Resource.create({"service.name": "test"})
-        
-        scope_metrics = MagicMock()
-        
-        metric = MagicMock()
-        metric.name = "test_metric"
-        metric.description = "Test metric"
-        metric.unit = "1"
-        
-        data_point = MagicMock()
-        data_point.attributes = {"label": "value"}
-        data_point.start_time_unix_nano = 1000
-        data_point.time_unix_nano = 2000
-        data_point.value = 42
-        
-        metric.data.data_points = [data_point]
-        scope_metrics.metrics = [metric]
-        resource_metrics.scope_metrics = [scope_metrics]
-        metric_data.resource_metrics = [resource_metrics]
+        # Plain stand-ins for the OTel metric structure
+        data_point = SimpleNamespace(
+            attributes={"label": "value"},
+            start_time_unix_nano=1000,
+            time_unix_nano=2000,
+            value=42
+        )
+        metric = SimpleNamespace(
+            name="test_metric",
+            description="Test metric",
+            unit="1",
+            data=SimpleNamespace(data_points=[data_point])
+        )
+        resource_metrics = SimpleNamespace(
+            resource=Resource.create({"service.name": "test"}),
+            scope_metrics=[SimpleNamespace(metrics=[metric])]
+        )
+        metric_data = SimpleNamespace(resource_metrics=[resource_metrics])
 
         exporter.export(metric_data)
 
-        assert http_transport.send_events.called
-        events = http_transport.send_events.call_args[0][0]
+        http_transport.enqueue_events.assert_called_once()
+        (events,) = http_transport.enqueue_events.call_args.args
         assert len(events) == 1
         assert events[0]["type"] == "metric"
         assert events[0]["name"] == "test_metric"
         assert events[0]["data_points"][0]["value"] == 42
+
+    def test_shutdown_flushes(self, exporter, http_transport):
+        """Test shutdown sends queued metrics before returning."""
+        exporter.shutdown(timeout_millis=2000)
+
+        http_transport.flush.assert_called_once_with(timeout=2.0)
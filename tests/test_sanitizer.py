@@ -1,15 +1,46 @@
 """Tests for PII sanitization."""
 
 import pytest
+from rootsense.utils import sanitizer as sanitizer_module
 from rootsense.utils.sanitizer import Sanitizer
 
 
+@pytest.fixture(scope="module")
+def sanitizer():
+    """Create one PII sanitizer for the module."""
+    return Sanitizer(sanitize_pii=True)
+
+
 class TestSanitizer:
     """Test PII sanitization."""
 
-    def test_sanitize_enabled(self):
-        """Test sanitization when enabled."""
-        sanitizer = Sanitizer(sanitize_pii=True)
+    @pytest.mark.parametrize("sanitize_pii,expected", [
+        pytest.param(
+            True,
+            {
+                "password": "[REDACTED]",
+                "api_key": "[REDACTED]",
+                "token": "[REDACTED]",
+                "credit_card": "[REDACTED]",
+                "safe_data": "visible"
+            },
+            id="enabled"
+        ),
+        pytest.param(
+            False,
+            {
+                "password": "secret123",
+                "api_key": "key-12345",
+                "token": "bearer-token",
+                "credit_card": "1234-5678-9012-3456",
+                "safe_data": "visible"
+            },
+            id="disabled"
+        ),
+    ])
+    def test_sanitize(self, sanitize_pii, expected):
+        """Test sensitive keys are redacted only when sanitization is enabled."""
+        sanitizer = Sanitizer(sanitize_pii=sanitize_pii)
         
         data = {
             "password": "secret123",
@@ -19,44 +50,120 @@ class TestSanitizer:
             "safe_data": "visible"
         }
         
-        result = sanitizer.sanitize_dict(data)
+        assert sanitizer.sanitize_dict(data) == expected
+
+    @pytest.mark.parametrize("data,expected", [
+        pytest.param(
+            {
+                "user": {
+                    "password": "secret",
+                    "name": "John"
+                },
+                "metadata": {
+                    "token": "abc123"
+                }
+            },
+            {
+                "user": {
+                    "password": "[REDACTED]",
+                    "name": "John"
+                },
+                "metadata": {
+                    "token": "[REDACTED]"
+                }
+            },
+            id="nested"
+        ),
+        pytest.param(
+            {"items": [{"password": "secret"}, {"name": "John"}, 3]},
+            {"items": [{"password": "[REDACTED]"}, {"name": "John"}, 3]},
+            id="list"
+        ),
+        pytest.param(
+            {
+                "message": "Contact john.doe@example.com or 555-123-4567, "
+                           "SSN 123-45-6789, card 1234 5678 9012 3456"
+            },
+            {
+                "message": "Contact j******e@example.com or XXX-XXX-XXXX, "
+                           "SSN XXX-XX-XXXX, card XXXX-XXXX-XXXX-XXXX"
+            },
+            id="string_pii"
+        ),
+    ])
+    def test_sanitize_values(self, sanitizer, data, expected):
+        """Test sensitive keys and PII in values are redacted at any depth."""
+        assert sanitizer.sanitize_dict(data) == expected
+
+    @pytest.mark.skipif(not sanitizer_module.HYPERSCAN_AVAILABLE, reason="hyperscan not installed")
+    def test_hyperscan_prescreen(self):
+        """Test Hyperscan pre-screening agrees with the regex."""
+        sanitizer = Sanitizer(sanitize_pii=True)
         
-        assert result["password"] == "[REDACTED]"
-        assert result["api_key"] == "[REDACTED]"
-        assert result["token"] == "[REDACTED]"
-        assert result["credit_card"] == "[REDACTED]"
-        assert result["safe_data"] == "visible"
+        assert sanitizer._pii_database is not None
+        assert sanitizer._may_contain_pii("call 555-123-4567") is True
+        assert sanitizer._may_contain_pii("nothing sensitive here") is False
+        assert sanitizer._sanitize_string("nothing sensitive here") == "nothing sensitive here"
+        assert sanitizer._sanitize_string("call 555-123-4567") == "call XXX-XXX-XXXX"
 
-    def test_sanitize_disabled(self):
-        """Test that sanitization can be disabled."""
-        sanitizer = Sanitizer(sanitize_pii=False)
+    def test_regex_fallback_without_hyperscan(self, monkeypatch):
+        """Test strings are still masked when Hyperscan is unavailable."""
+        monkeypatch.setattr(sanitizer_module, "HYPERSCAN_AVAILABLE", False)
+        sanitizer = Sanitizer(sanitize_pii=True)
         
-        data = {
-            "password": "secret123",
-            "api_key": "key-12345"
-        }
+        assert sanitizer._pii_database is None
+        assert sanitizer._sanitize_string("call 555-123-4567") == "call XXX-XXX-XXXX"
+
+    @pytest.mark.parametrize("automaton", [True, False])
+    def test_sensitive_key_matching(self, monkeypatch, automaton):
+        """Test sensitive keys match as case-insensitive substrings."""
+        if automaton and not sanitizer_module.AHOCORASICK_AVAILABLE:
+            pytest.skip("pyahocorasick not installed")
+        monkeypatch.setattr(sanitizer_module, "AHOCORASICK_AVAILABLE", automaton)
+        sanitizer = Sanitizer(sanitize_pii=True)
         
-        result = sanitizer.sanitize_dict(data)
+        assert sanitizer._is_sensitive_key("X-Refresh_Token") is True
+        assert sanitizer._is_sensitive_key("user_PASSWORD") is True
+        assert sanitizer._is_sensitive_key("username") is False
+        assert sanitizer._is_sensitive_key("username") is False
+        assert sanitizer._is_sensitive_key.cache_info().hits == 1
+
+    def test_sensitive_key_pattern(self):
+        """Test the regex fallback matches every sensitive key in one pattern."""
+        pattern = Sanitizer.SENSITIVE_KEY_PATTERN
         
-        assert result["password"] == "secret123"
-        assert result["api_key"] == "key-12345"
+        assert all(pattern.search(f"x_{key}_y") for key in Sanitizer.SENSITIVE_KEYS)
+        assert pattern.search("username") is None
 
-    def test_nested_sanitization(self):
-        """Test sanitization of nested structures."""
-        sanitizer = Sanitizer(sanitize_pii=True)
+    def test_clean_subtrees_are_not_copied(self, sanitizer):
+        """Test dicts and lists with nothing to redact are returned as-is."""
+        clean = {"user": {"name": "John"}, "items": [{"id": 1}], "count": 3}
+        assert sanitizer.sanitize_dict(clean) is clean
         
-        data = {
-            "user": {
-                "password": "secret",
-                "name": "John"
-            },
-            "metadata": {
-                "token": "abc123"
-            }
+        data = {"user": {"name": "John"}, "items": [{"id": 1}, {"token": "abc"}]}
+        result = sanitizer.sanitize_dict(data)
+        
+        assert result is not data
+        assert result["user"] is data["user"]
+        assert result["items"][0] is data["items"][0]
+        assert result["items"][1]["token"] == "[REDACTED]"
+        # Input is left untouched
+        assert data["items"][1]["token"] == "abc"
+
+    def test_sanitize_headers(self, sanitizer):
+        """Test sensitive headers are redacted case-insensitively."""
+        headers = {
+            "Authorization": "Bearer abc",
+            "X-API-Key": "key-123",
+            "Cookie": "session=1",
+            "Accept": "application/json"
         }
         
-        result = sanitizer.sanitize_dict(data)
+        result = sanitizer.sanitize_headers(headers)
         
-        assert result["user"]["password"] == "[REDACTED]"
-        assert result["user"]["name"] == "John"
-        assert result["metadata"]["token"] == "[REDACTED]"
+        assert result == {
+            "Authorization": "[REDACTED]",
+            "X-API-Key": "[REDACTED]",
+            "Cookie": "[REDACTED]",
+            "Accept": "application/json"
+        }
@@ -1,114 +1,173 @@
 """Tests for HTTP transport."""
 
+import json
+import logging
 import pytest
+import threading
+import time
+import responses
 from unittest.mock import Mock, patch
-from rootsense.transport.http_transport import HttpTransport
+from rootsense.transport.http_transport import MAX_RETRY_AFTER, HttpTransport
 from rootsense.config import Config
 import requests
+from urllib3 import HTTPResponse
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError
 
-class TestHttpTransport:
-    """Test HTTP transport functionality."""
+BACKEND_URL = "https://api.test.com"
+BATCH_URL = f"{BACKEND_URL}/events/batch"
+SUCCESS_URL = f"{BACKEND_URL}/events/success"
+
+
+@pytest.fixture(scope="module")
+def config():
+    """Create test config."""
+    return Config(
+        api_key="test-key",
+        project_id="test-project",
+        backend_url=BACKEND_URL
+    )
+
+
+@pytest.fixture(scope="module")
+def transport(config):
+    """Create one transport instance for the module."""
+    transport = HttpTransport(config)
+    yield transport
+    transport.close()
+
+
+@pytest.fixture(autouse=True)
+def _restore_headers(transport):
+    """Undo any session header changes a test makes."""
+    headers = transport.session.headers.copy()
+    yield
+    transport.session.headers = headers
 
-    @pytest.fixture
-    def config(self):
-        """Create test config."""
-        return Config(
-            api_key="test-key",
-            project_id="test-project",
-            backend_url="https://api.test.com"
-        )
 
-    @pytest.fixture
-    def transport(self, config):
-        """Create transport instance."""
-        return HttpTransport(config)
+@pytest.fixture
+def http():
+    """Intercept requests at the adapter so sessions, headers and retries run for real."""
+    with responses.RequestsMock() as rsps:
+        yield rsps
+
+
+def request_payloads(http):
+    """Decode the JSON body of every intercepted request."""
+    return [json.loads(c.request.body) for c in http.calls]
+
+
+class TestHttpTransport:
+    """Test HTTP transport functionality."""
 
     def test_init(self, transport):
         """Test initialization."""
         assert transport.session.headers["X-API-Key"] == "test-key"
         assert transport.session.headers["Content-Type"] == "application/json"
 
-    @patch("requests.Session.post")
-    def test_send_events_success(self, mock_post, transport):
+    def test_send_events_success(self, http, transport):
         """Test successful event sending."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_post.return_value = mock_response
+        http.add(responses.POST, BATCH_URL, status=200)
 
         events = [{"event_id": "1"}]
         result = transport.send_events(events)
 
         assert result is True
-        mock_post.assert_called_once()
-        args, kwargs = mock_post.call_args
-        assert args[0] == "https://api.test.com/events/batch"
-        assert kwargs["json"]["events"] == events
-
-    @patch("requests.Session.post")
-    def test_send_events_client_error(self, mock_post, transport):
-        """Test client error (no retry)."""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad Request"
-        mock_post.return_value = mock_response
+        assert len(http.calls) == 1
+        assert http.calls[0].request.headers["X-API-Key"] == "test-key"
+        assert request_payloads(http) == [{"events": events}]
+
+    def test_send_events_batch(self, http, transport):
+        """Test a large batch goes out as one request to the batch endpoint."""
+        http.add(responses.POST, BATCH_URL, status=200)
+
+        events = [{"event_id": str(i)} for i in range(1000)]
+        assert transport.send_events(events) is True
+
+        assert len(http.calls) == 1
+        assert http.calls[0].request.url == BATCH_URL
+        assert len(request_payloads(http)[0]["events"]) == 1000
+
+    @pytest.mark.parametrize("status,expected_calls", [
+        # Client errors are not retried
+        pytest.param(400, 1, id="client_error"),
+        # Server errors are retried by the adapter until Retry.total runs out
+        pytest.param(500, 4, id="server_error"),
+    ])
+    def test_send_events_failure(self, http, transport, status, expected_calls):
+        """Test error statuses return False once the adapter has given up."""
+        http.add(responses.POST, BATCH_URL, status=status, body="Error")
 
         result = transport.send_events([{"event_id": "1"}])
 
         assert result is False
-        # Should not retry on 4xx
-        assert mock_post.call_count == 1
+        assert len(http.calls) == expected_calls
 
-    @patch("requests.Session.post")
-    def test_send_events_server_error_retry(self, mock_post, transport):
-        """Test server error with retry."""
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_post.return_value = mock_response
+    def test_send_events_request_exception(self, http, transport):
+        """Test a request exception makes send_events return False.
 
-        # Mock sleep to speed up test
-        with patch("time.sleep"):
-            result = transport.send_events([{"event_id": "1"}])
+        responses raises body exceptions without going through urllib3's
+        Retry, so connection retries are covered by test_retry_policy.
+        """
+        http.add(responses.POST, BATCH_URL, body=requests.ConnectionError("Connection error"))
 
-        assert result is False
-        # Should retry 3 times
-        assert mock_post.call_count == 3
+        assert transport.send_events([{"event_id": "1"}]) is False
 
-    @patch("requests.Session.post")
-    def test_send_events_exception_retry(self, mock_post, transport):
-        """Test exception with retry."""
-        mock_post.side_effect = requests.RequestException("Connection error")
+    def test_send_events_success_after_retry(self, http, transport):
+        """Test the adapter retries server errors and returns the eventual success."""
+        http.add(responses.POST, BATCH_URL, status=500)
+        http.add(responses.POST, BATCH_URL, status=503)
+        http.add(responses.POST, BATCH_URL, status=200)
 
-        # Mock sleep
-        with patch("time.sleep"):
-            result = transport.send_events([{"event_id": "1"}])
+        assert transport.send_events([{"event_id": "1"}]) is True
+        assert len(http.calls) == 3
 
-        assert result is False
-        assert mock_post.call_count == 3
+    def test_retries_are_logged_once_each(self, http, transport, caplog):
+        """Test each status retry logs one warning and the final failure logs none."""
+        http.add(responses.POST, BATCH_URL, status=500)
 
-    @patch("requests.Session.post")
-    def test_send_events_success_after_retry(self, mock_post, transport):
-        """Test success after retry."""
-        fail_response = Mock()
-        fail_response.status_code = 500
-        
-        success_response = Mock()
-        success_response.status_code = 200
+        with caplog.at_level(logging.WARNING, logger="rootsense.transport.http_transport"):
+            assert transport.send_events([{"event_id": "1"}]) is False
 
-        # Fail twice, then succeed
-        mock_post.side_effect = [fail_response, fail_response, success_response]
+        retries = [r for r in caplog.records if r.getMessage().startswith("Retrying")]
+        assert len(http.calls) == 4
+        assert len(retries) == 3
 
-        with patch("time.sleep"):
-            result = transport.send_events([{"event_id": "1"}])
+    def test_retry_policy(self, transport):
+        """Test the adapter retries server errors with backoff and Retry-After."""
+        retry = transport.session.get_adapter(BACKEND_URL).max_retries
 
-        assert result is True
-        assert mock_post.call_count == 3
+        assert retry.total == 3
+        assert retry.backoff_factor > 0
+        assert retry.backoff_jitter > 0
+        assert retry.respect_retry_after_header is True
+        assert 503 in retry.status_forcelist
+        assert 400 not in retry.status_forcelist
+        assert retry.is_retry("POST", 503)
+
+    def test_retry_after_is_capped(self, transport):
+        """Test a long Retry-After can't stall delivery beyond MAX_RETRY_AFTER."""
+        retry = transport.session.get_adapter(BACKEND_URL).max_retries
+        response = HTTPResponse(status=429, headers={"Retry-After": "3600"})
+
+        assert retry.get_retry_after(response) == MAX_RETRY_AFTER
+        assert retry.parse_retry_after("1") == 1
 
-    @patch("requests.Session.post")
-    def test_send_success_signal(self, mock_post, transport):
+    def test_retry_policy_connection_errors(self, transport):
+        """Test refused connections are retried until Retry.total runs out."""
+        retry = transport.session.get_adapter(BACKEND_URL).max_retries
+        # NewConnectionError (connection refused) is a ConnectTimeoutError
+        error = ConnectTimeoutError("Connection refused")
+
+        # connect=None leaves connection retries bounded by total
+        assert retry.connect is None
+        for _ in range(retry.total):
+            retry = retry.increment(method="POST", url=BATCH_URL, error=error)
+        with pytest.raises(MaxRetryError):
+            retry.increment(method="POST", url=BATCH_URL, error=error)
+
+    def test_send_success_signal(self, http, transport):
         """Test sending success signal."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_post.return_value = mock_response
+        http.add(responses.POST, SUCCESS_URL, status=200)
 
         fingerprint = "test-fingerprint"
         context = {"method": "GET"}
@@ -116,8 +175,201 @@ class TestHttpTransport:
         result = transport.send_success_signal(fingerprint, context)
 
         assert result is True
-        mock_post.assert_called_once()
-        args, kwargs = mock_post.call_args
-        assert args[0] == "https://api.test.com/events/success"
-        assert kwargs["json"]["fingerprint"] == fingerprint
-        assert kwargs["json"]["context"] == context
+        assert request_payloads(http) == [{
+            "fingerprint": fingerprint,
+            "context": context,
+            "project_id": "test-project",
+            "environment": "production"
+        }]
+
+    def test_enqueue_events_coalesces(self, http, config):
+        """Test queued events are sent together in one batch request."""
+        http.add(responses.POST, BATCH_URL, status=200)
+
+        # Closes its transport to flush, so it can't use the shared one
+        transport = HttpTransport(config)
+        transport.enqueue_events([{"event_id": "1"}])
+        transport.enqueue_events([{"event_id": "2"}, {"event_id": "3"}])
+        transport.close()
+
+        assert len(http.calls) == 1
+        assert [e["event_id"] for e in request_payloads(http)[0]["events"]] == ["1", "2", "3"]
+
+    def test_enqueue_events_respects_max_batch_size(self, http):
+        """Test queued events are split into batches of at most max_batch_size."""
+        http.add(responses.POST, BATCH_URL, status=200)
+
+        config = Config(
+            api_key="test-key",
+            project_id="test-project",
+            backend_url=BACKEND_URL,
+            batch_interval_ms=60000,
+            max_batch_size=2
+        )
+        transport = HttpTransport(config)
+        transport.enqueue_events([{"event_id": str(i)} for i in range(5)])
+        transport.close()
+
+        sizes = [len(payload["events"]) for payload in request_payloads(http)]
+        assert sum(sizes) == 5
+        assert max(sizes) <= 2
+
+    def test_enqueue_events_bounded_by_buffer_size(self, http):
+        """Test events beyond buffer_size are dropped instead of queued."""
+        http.add(responses.POST, BATCH_URL, status=200)
+
+        config = Config(
+            api_key="test-key",
+            project_id="test-project",
+            backend_url=BACKEND_URL,
+            batch_interval_ms=60000,
+            buffer_size=3
+        )
+        transport = HttpTransport(config)
+        transport.enqueue_events([{"event_id": str(i)} for i in range(5)])
+        transport.close()
+
+        sent = [e["event_id"] for payload in request_payloads(http) for e in payload["events"]]
+        assert sent == ["0", "1", "2"]
+
+    def test_flush_sends_queued_events(self, http, transport):
+        """Test flush sends queued events without waiting for the interval."""
+        http.add(responses.POST, BATCH_URL, status=200)
+
+        transport.enqueue_events([{"event_id": "1"}, {"event_id": "2"}])
+
+        assert transport.flush(timeout=5) is True
+        assert [e["event_id"] for e in request_payloads(http)[0]["events"]] == ["1", "2"]
+
+    def test_close_gives_up_after_timeout(self, monkeypatch):
+        """Test close stops sending once its deadline passes instead of draining everything."""
+        sent = []
+
+        def slow_send(batch):
+            sent.append(batch)
+            time.sleep(0.1)
+            return True
+
+        config = Config(
+            api_key="test-key",
+            project_id="test-project",
+            backend_url=BACKEND_URL,
+            batch_interval_ms=60000,
+            max_batch_size=1
+        )
+        transport = HttpTransport(config)
+        monkeypatch.setattr(transport._batch_buffer, "_send", slow_send)
+        transport.enqueue_events([{"event_id": str(i)} for i in range(50)])
+
+        start = time.monotonic()
+        transport._batch_buffer.close(timeout=0.3)
+
+        assert time.monotonic() - start < 1
+        assert len(sent) < 50
+        assert not transport._batch_buffer._events
+        transport.close()
+
+    def test_enqueue_events_after_close(self, http, config):
+        """Test events enqueued after close are dropped, not left queued."""
+        transport = HttpTransport(config)
+        transport.close()
+
+        transport.enqueue_events([{"event_id": "1"}])
+
+        assert not transport._batch_buffer._events
+        assert len(http.calls) == 0
+
+    def test_connection_pool(self, transport):
+        """Test the session keeps a pool of keep-alive connections."""
+        adapter = transport.session.get_adapter(BACKEND_URL)
+
+        assert isinstance(transport.session, requests.Session)
+        assert adapter._pool_connections == 32
+        assert adapter._pool_maxsize == 32
+        assert transport.session.headers["Connection"] == "keep-alive"
+
+    def test_session_is_reused(self, http, transport, monkeypatch):
+        """Test every request goes through the pooled session, not requests.post."""
+        module_post = Mock()
+        monkeypatch.setattr(requests, "post", module_post)
+        http.add(responses.POST, BATCH_URL, status=200)
+        http.add(responses.POST, SUCCESS_URL, status=200)
+
+        transport.send_events([{"event_id": "1"}])
+        transport.send_events([{"event_id": "2"}])
+        transport.send_success_signal("fp", {"method": "GET"})
+
+        assert len(http.calls) == 3
+        module_post.assert_not_called()
+
+    @patch("rootsense.transport.http_transport.ORJSON_AVAILABLE", False)
+    def test_send_events_stdlib_json_fallback(self, http, transport):
+        """Test events are still serialized when orjson is not installed."""
+        http.add(responses.POST, BATCH_URL, status=200)
+
+        events = [{"event_id": "1", "labels": {"code": 500}}]
+        assert transport.send_events(events) is True
+
+        assert isinstance(http.calls[0].request.body, bytes)
+        assert request_payloads(http) == [{"events": events}]
+
+    def test_enqueue_success_signal(self, http, transport):
+        """Test success signals can be sent from a background thread."""
+        http.add(responses.POST, SUCCESS_URL, status=200)
+
+        future = transport.enqueue_success_signal("fp", {"method": "GET"})
+
+        assert future.result(timeout=5) is True
+        assert http.calls[0].request.url == SUCCESS_URL
+
+    def test_enqueue_success_signal_after_close(self, http, config):
+        """Test a success signal after close resolves to False instead of raising."""
+        transport = HttpTransport(config)
+        transport.close()
+
+        future = transport.enqueue_success_signal("fp", {"method": "GET"})
+
+        assert future.result(timeout=0) is False
+        assert len(http.calls) == 0
+
+    def test_enqueue_success_signal_drops_when_full(self, monkeypatch):
+        """Test signals past buffer_size are dropped instead of queued."""
+        release = threading.Event()
+        sent = []
+
+        def blocking_send(fingerprint, context):
+            release.wait(5)
+            sent.append(fingerprint)
+            return True
+
+        config = Config(
+            api_key="test-key",
+            project_id="test-project",
+            backend_url=BACKEND_URL,
+            buffer_size=3
+        )
+        transport = HttpTransport(config)
+        monkeypatch.setattr(transport, "send_success_signal", blocking_send)
+
+        futures = [transport.enqueue_success_signal(f"fp-{i}", {}) for i in range(5)]
+
+        assert [f.done() for f in futures] == [False, False, False, True, True]
+        assert futures[3].result() is False
+        release.set()
+        transport.close()
+        assert sorted(sent) == ["fp-0", "fp-1", "fp-2"]
+
+    def test_close_does_not_wait_for_success_signal_backlog(self, monkeypatch, config):
+        """Test close cancels signals still queued once its deadline passes."""
+        release = threading.Event()
+        transport = HttpTransport(config)
+        monkeypatch.setattr(transport, "send_success_signal", lambda *args: release.wait(5))
+
+        futures = [transport.enqueue_success_signal(f"fp-{i}", {}) for i in range(10)]
+
+        start = time.monotonic()
+        transport.close(timeout=0.2)
+
+        assert time.monotonic() - start < 1
+        assert all(f.cancelled() for f in futures[2:])
+        release.set()
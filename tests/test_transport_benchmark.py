@@ -0,0 +1,36 @@
+"""Benchmarks for the HTTP transport hot path.
+
+Deselected by default and skipped unless pytest-benchmark is installed. Run with
+``pytest tests/test_transport_benchmark.py -m benchmark --benchmark-only``.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from rootsense.config import Config
+from rootsense.transport.http_transport import HttpTransport
+
+
+@pytest.fixture(scope="module")
+def transport():
+    """Create one transport instance for the module."""
+    transport = HttpTransport(Config(
+        api_key="test-key",
+        project_id="test-project",
+        backend_url="https://api.test.com"
+    ))
+    yield transport
+    transport.close()
+
+
+@pytest.mark.benchmark(group="transport")
+def test_send_events_bench(benchmark, transport, monkeypatch):
+    """Measure SDK overhead of sending a 100-event batch, network excluded."""
+    monkeypatch.setattr(transport.session, "post", Mock(return_value=SimpleNamespace(status_code=200)))
+    events = [{"event_id": str(i), "type": "error", "message": "boom"} for i in range(100)]
+
+    assert benchmark(transport.send_events, events) is True
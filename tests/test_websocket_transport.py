@@ -0,0 +1,49 @@
+"""Tests for WebSocket transport."""
+
+import pytest
+from unittest.mock import Mock, patch
+from rootsense.transport.websocket_transport import WebSocketTransport
+from rootsense.config import Config
+
+
+class TestWebSocketTransport:
+    """Test WebSocket message handling."""
+
+    @pytest.fixture
+    def config(self):
+        """Create test config."""
+        return Config(
+            api_key="test-key",
+            project_id="test-project",
+            backend_url="https://api.test.com"
+        )
+
+    @pytest.fixture
+    def transport(self, config):
+        """Create transport instance."""
+        return WebSocketTransport(config)
+
+    def test_message_not_parsed_without_consumers(self, transport):
+        """Test messages are dropped unparsed when debug is off and no handlers exist."""
+        with patch("rootsense.transport.websocket_transport._loads") as mock_loads:
+            transport._handle_message('{"type": "ping"}')
+
+        assert not mock_loads.called
+
+    def test_handlers_receive_parsed_message(self, transport):
+        """Test registered handlers get the parsed message."""
+        handler = Mock()
+        transport.add_handler(handler)
+
+        transport._handle_message('{"type": "ping", "id": 1}')
+
+        handler.assert_called_once_with({"type": "ping", "id": 1})
+
+    def test_invalid_message(self, transport):
+        """Test malformed messages are logged and not dispatched."""
+        handler = Mock()
+        transport.add_handler(handler)
+
+        transport._handle_message("not json")
+
+        assert not handler.called